@@ -2,22 +2,28 @@
 Visualization functions for books dataset analysis.
 """
 
+import os
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
-from typing import Optional, List, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional, List, Tuple
 import warnings
 warnings.filterwarnings('ignore')
 
-# Set style for better-looking plots
 try:
-    plt.style.use('seaborn-v0_8')
-except OSError:
-    # Fallback to a basic style if seaborn style is not available
-    plt.style.use('ggplot')
-    
-sns.set_palette("husl")
+    import pyarrow as pa
+    # Exploding Arrow list columns natively needs pandas >= 2.1
+    USE_ARROW_STRINGS = tuple(int(part) for part in pd.__version__.split('.')[:2]) >= (2, 1)
+except ImportError:
+    USE_ARROW_STRINGS = False
+
+try:
+    from ..utils.helpers import get_numeric_columns, needs_deep_memory_usage
+except ImportError:
+    # Imported as a top-level module with src/ on the path (notebooks)
+    from utils.helpers import get_numeric_columns, needs_deep_memory_usage
 
 
 def setup_plot_style():
@@ -39,6 +45,141 @@ def setup_plot_style():
     plt.rcParams['ytick.labelsize'] = 10
 
 
+# Set style for better-looking plots once at import, so the plot functions
+# don't re-apply it; set NO_PLOT_STYLE to leave rcParams untouched
+if not os.environ.get('NO_PLOT_STYLE'):
+    try:
+        plt.style.use('seaborn-v0_8')
+    except OSError:
+        # Fallback to a basic style if seaborn style is not available
+        plt.style.use('ggplot')
+    
+    sns.set_palette("husl")
+    setup_plot_style()
+
+
+def _split_multi_value(values: pd.Series, drop_unknown: bool = True) -> pd.Series:
+    """
+    Split delimited multi-value strings (e.g. categories, authors) into one entry per row.
+    
+    Args:
+        values: Series of strings delimited by ',', '&' or ';'
+        drop_unknown: Whether to skip 'Unknown' placeholder entries
+        
+    Returns:
+        Series with one stripped, non-empty value per row
+    """
+    values = values.dropna()
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        entries = values.cat.categories
+    else:
+        entries = values
+    if entries.dtype == object and pd.api.types.infer_dtype(entries, skipna=True) != 'string':
+        # Skip non-string entries such as stray numbers in mixed columns
+        values = values[values.map(lambda value: isinstance(value, str)).astype(bool)]
+    if len(values) == 0:
+        return pd.Series([], dtype=object)
+    
+    if USE_ARROW_STRINGS:
+        # Split, explode and value_counts then all run as Arrow kernels
+        values = values.astype(pd.ArrowDtype(pa.string()))
+    
+    if drop_unknown:
+        values = values[values.str.lower().ne('unknown')]
+    
+    # Split on all delimiters in one regex pass
+    exploded = values.str.split(r'[,&;]', regex=True).explode().str.strip()
+    return exploded[exploded.notna() & exploded.ne('')]
+
+
+def _clean_pub_years(df: pd.DataFrame, min_year: int = 1800, max_year: int = 2024) -> pd.Series:
+    """
+    Extract publication years within a reasonable range.
+    
+    Args:
+        df: Books DataFrame
+        min_year: Earliest year to keep
+        max_year: Latest year to keep
+        
+    Returns:
+        Series of publication years without missing or out-of-range values
+    """
+    pub_years = df['published_year'].dropna()
+    return pub_years[pub_years.between(min_year, max_year)]
+
+
+def _histogram(values: pd.Series, bins: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Bin values with numpy, skipping missing values.
+    
+    Args:
+        values: Values to bin
+        bins: Number of bins
+        
+    Returns:
+        Tuple of (binned values, bin counts, bin edges)
+    """
+    values = values.to_numpy(dtype=float, na_value=np.nan)
+    values = values[~np.isnan(values)]
+    
+    counts, edges = np.histogram(values, bins=bins)
+    return values, counts, edges
+
+
+def _fast_hist(ax: plt.Axes, counts: np.ndarray, edges: np.ndarray, **style) -> None:
+    """
+    Draw a histogram from bin counts precomputed with numpy.
+    
+    Args:
+        ax: Axes to draw on
+        counts: Bin counts
+        edges: Bin edges
+        **style: Keyword arguments passed to ax.bar
+    """
+    ax.bar(edges[:-1], counts, width=np.diff(edges), align='edge', **style)
+
+
+def _sample_points(df: pd.DataFrame, x_col: str, y_col: str, n_samples: int = 1000,
+                   random_state: int = 42) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Sample row positions and pull only the two plotted columns.
+    
+    Args:
+        df: Books DataFrame
+        x_col: Column for the x values
+        y_col: Column for the y values
+        n_samples: Maximum number of points
+        random_state: Random seed
+        
+    Returns:
+        Tuple of (x, y) float arrays with missing values as NaN
+    """
+    n = min(n_samples, len(df))
+    idx = np.random.default_rng(random_state).choice(len(df), size=n, replace=False)
+    x = df[x_col].iloc[idx].to_numpy(dtype=float, na_value=np.nan)
+    y = df[y_col].iloc[idx].to_numpy(dtype=float, na_value=np.nan)
+    return x, y
+
+
+def _prepare_panels(*tasks: Optional[Callable[[], Any]]) -> List[Any]:
+    """
+    Run independent panel data-preparation tasks on a thread pool.
+    
+    Many pandas/numpy aggregations release the GIL, so the panels' data
+    prep can overlap. Drawing stays on the calling thread because
+    matplotlib is not thread-safe.
+    
+    Args:
+        *tasks: Zero-argument callables, one per panel, or None to skip a panel
+        
+    Returns:
+        Task results in the order given, with None for skipped panels
+    """
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [executor.submit(task) if task is not None else None for task in tasks]
+        return [future.result() if future is not None else None for future in futures]
+
+
 def plot_data_overview(df: pd.DataFrame) -> None:
     """
     Create an overview visualization of the dataset.
@@ -46,14 +187,12 @@ def plot_data_overview(df: pd.DataFrame) -> None:
     Args:
         df: Books DataFrame
     """
-    setup_plot_style()
-    
     fig, axes = plt.subplots(2, 2, figsize=(15, 12))
     
     # Dataset shape info
     axes[0, 0].text(0.1, 0.7, f"Dataset Shape: {df.shape[0]} rows, {df.shape[1]} columns", 
                     fontsize=16, transform=axes[0, 0].transAxes)
-    axes[0, 0].text(0.1, 0.5, f"Memory Usage: {df.memory_usage(deep=True).sum() / 1024**2:.2f} MB", 
+    axes[0, 0].text(0.1, 0.5, f"Memory Usage: {df.memory_usage(deep=needs_deep_memory_usage(df)).sum() / 1024**2:.2f} MB", 
                     fontsize=14, transform=axes[0, 0].transAxes)
     axes[0, 0].text(0.1, 0.3, f"Columns: {', '.join(df.columns[:5])}...", 
                     fontsize=12, transform=axes[0, 0].transAxes)
@@ -81,7 +220,7 @@ def plot_data_overview(df: pd.DataFrame) -> None:
     # Sample of data
     axes[1, 1].axis('tight')
     axes[1, 1].axis('off')
-    table_data = df.head(3)[['title', 'authors', 'categories']].fillna('N/A')
+    table_data = df.head(3)[['title', 'authors', 'categories']].astype(object).fillna('N/A')
     table = axes[1, 1].table(cellText=table_data.values, 
                             colLabels=table_data.columns,
                             cellLoc='left', loc='center')
@@ -101,42 +240,51 @@ def plot_rating_analysis(df: pd.DataFrame) -> None:
     Args:
         df: Books DataFrame
     """
-    setup_plot_style()
+    has_rating = 'average_rating' in df.columns
+    has_count = 'ratings_count' in df.columns
+    
+    rating_hist, count_hist, points, top_rated = _prepare_panels(
+        (lambda: _histogram(df['average_rating'], bins=30)) if has_rating else None,
+        # Log scale for better visualization
+        (lambda: _histogram(np.log1p(df['ratings_count'].fillna(0)), bins=30)) if has_count else None,
+        (lambda: _sample_points(df, 'ratings_count', 'average_rating')) if has_rating and has_count else None,
+        (lambda: df.nlargest(10, 'average_rating')[['title', 'average_rating', 'authors']])
+        if has_rating and 'title' in df.columns else None
+    )
     
     fig, axes = plt.subplots(2, 2, figsize=(15, 12))
     
     # Rating distribution
-    if 'average_rating' in df.columns:
-        df['average_rating'].hist(bins=30, ax=axes[0, 0], alpha=0.7, color='skyblue', edgecolor='black')
+    if rating_hist is not None:
+        ratings, counts, edges = rating_hist
+        mean_rating = ratings.mean()
+        _fast_hist(axes[0, 0], counts, edges, alpha=0.7, color='skyblue', edgecolor='black')
         axes[0, 0].set_title("Distribution of Average Ratings")
         axes[0, 0].set_xlabel("Average Rating")
         axes[0, 0].set_ylabel("Frequency")
-        axes[0, 0].axvline(df['average_rating'].mean(), color='red', linestyle='--', 
-                          label=f'Mean: {df["average_rating"].mean():.2f}')
+        axes[0, 0].axvline(mean_rating, color='red', linestyle='--', 
+                          label=f'Mean: {mean_rating:.2f}')
         axes[0, 0].legend()
     
     # Ratings count distribution
-    if 'ratings_count' in df.columns:
-        # Log scale for better visualization
-        ratings_count_log = np.log1p(df['ratings_count'].fillna(0))
-        ratings_count_log.hist(bins=30, ax=axes[0, 1], alpha=0.7, color='lightgreen', edgecolor='black')
+    if count_hist is not None:
+        _, counts, edges = count_hist
+        _fast_hist(axes[0, 1], counts, edges, alpha=0.7, color='lightgreen', edgecolor='black')
         axes[0, 1].set_title("Distribution of Ratings Count (Log Scale)")
         axes[0, 1].set_xlabel("Log(Ratings Count + 1)")
         axes[0, 1].set_ylabel("Frequency")
     
     # Rating vs Ratings Count
-    if 'average_rating' in df.columns and 'ratings_count' in df.columns:
-        sample_df = df.sample(n=min(1000, len(df)))  # Sample for better performance
-        axes[1, 0].scatter(sample_df['ratings_count'], sample_df['average_rating'], 
-                          alpha=0.6, color='purple')
+    if points is not None:
+        x, y = points
+        axes[1, 0].scatter(x, y, alpha=0.6, color='purple')
         axes[1, 0].set_xlabel("Ratings Count")
         axes[1, 0].set_ylabel("Average Rating")
         axes[1, 0].set_title("Average Rating vs Ratings Count")
         axes[1, 0].set_xscale('log')
     
     # Top rated books
-    if 'average_rating' in df.columns and 'title' in df.columns:
-        top_rated = df.nlargest(10, 'average_rating')[['title', 'average_rating', 'authors']]
+    if top_rated is not None:
         y_pos = np.arange(len(top_rated))
         axes[1, 1].barh(y_pos, top_rated['average_rating'], color='gold')
         axes[1, 1].set_yticks(y_pos)
@@ -156,24 +304,25 @@ def plot_publication_analysis(df: pd.DataFrame) -> None:
     Args:
         df: Books DataFrame
     """
-    setup_plot_style()
-    
     fig, axes = plt.subplots(2, 2, figsize=(15, 12))
     
     if 'published_year' in df.columns:
         # Clean publication year data
-        pub_years = df['published_year'].dropna()
-        pub_years = pub_years[(pub_years >= 1800) & (pub_years <= 2024)]  # Reasonable range
+        pub_years = _clean_pub_years(df)
+        year_hist, yearly_counts = _prepare_panels(
+            lambda: _histogram(pub_years, bins=50),
+            lambda: pub_years.value_counts().sort_index()
+        )
         
         # Publication year distribution
-        pub_years.hist(bins=50, ax=axes[0, 0], alpha=0.7, color='lightcoral', edgecolor='black')
+        _, counts, edges = year_hist
+        _fast_hist(axes[0, 0], counts, edges, alpha=0.7, color='lightcoral', edgecolor='black')
         axes[0, 0].set_title("Distribution of Publication Years")
         axes[0, 0].set_xlabel("Publication Year")
         axes[0, 0].set_ylabel("Number of Books")
         
         # Books per decade
-        decades = (pub_years // 10) * 10
-        decade_counts = decades.value_counts().sort_index()
+        decade_counts = yearly_counts.groupby((yearly_counts.index // 10) * 10).sum()
         decade_counts.plot(kind='bar', ax=axes[0, 1], color='teal')
         axes[0, 1].set_title("Books Published by Decade")
         axes[0, 1].set_xlabel("Decade")
@@ -181,16 +330,14 @@ def plot_publication_analysis(df: pd.DataFrame) -> None:
         axes[0, 1].tick_params(axis='x', rotation=45)
         
         # Publication trend over time
-        yearly_counts = pub_years.value_counts().sort_index()
         yearly_counts.plot(ax=axes[1, 0], color='green', linewidth=2)
         axes[1, 0].set_title("Publication Trend Over Time")
         axes[1, 0].set_xlabel("Year")
         axes[1, 0].set_ylabel("Number of Books")
         
         # Recent publications (last 20 years)
-        recent_years = pub_years[pub_years >= 2004]
-        if len(recent_years) > 0:
-            recent_counts = recent_years.value_counts().sort_index()
+        recent_counts = yearly_counts.loc[yearly_counts.index >= 2004]
+        if len(recent_counts) > 0:
             recent_counts.plot(kind='bar', ax=axes[1, 1], color='orange')
             axes[1, 1].set_title("Publications in Recent Years (2004+)")
             axes[1, 1].set_xlabel("Year")
@@ -201,6 +348,24 @@ def plot_publication_analysis(df: pd.DataFrame) -> None:
     plt.show()
 
 
+def _page_hist(df: pd.DataFrame) -> Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    """
+    Bin page counts within a reasonable range.
+    
+    Args:
+        df: Books DataFrame
+        
+    Returns:
+        Histogram tuple from _histogram, or None if no page counts are in range
+    """
+    pages = df['num_pages'].dropna()
+    pages = pages[(pages > 0) & (pages < 2000)]  # Reasonable range
+    
+    if len(pages) == 0:
+        return None
+    return _histogram(pages, bins=30)
+
+
 def plot_category_analysis(df: pd.DataFrame) -> None:
     """
     Analyze book categories and genres.
@@ -208,71 +373,51 @@ def plot_category_analysis(df: pd.DataFrame) -> None:
     Args:
         df: Books DataFrame
     """
-    setup_plot_style()
+    # Split multiple categories/authors, flatten and count
+    category_counts, page_hist, author_counts = _prepare_panels(
+        (lambda: _split_multi_value(df['categories']).value_counts().head(15)) if 'categories' in df.columns else None,
+        (lambda: _page_hist(df)) if 'num_pages' in df.columns else None,
+        (lambda: _split_multi_value(df['authors']).value_counts().head(10)) if 'authors' in df.columns else None
+    )
     
     fig, axes = plt.subplots(2, 2, figsize=(15, 12))
     
-    if 'categories' in df.columns:
-        # Clean and extract categories
-        categories = df['categories'].dropna()
-        # Split multiple categories and flatten
-        all_categories = []
-        for cat_string in categories:
-            if isinstance(cat_string, str) and cat_string.lower() != 'unknown':
-                # Split by common delimiters
-                cats = cat_string.replace(',', ';').replace('&', ';').split(';')
-                all_categories.extend([cat.strip() for cat in cats if cat.strip()])
+    if category_counts is not None and len(category_counts) > 0:
+        # Top categories
+        category_counts.plot(kind='barh', ax=axes[0, 0], color='lightblue')
+        axes[0, 0].set_title("Top 15 Book Categories")
+        axes[0, 0].set_xlabel("Number of Books")
         
-        if all_categories:
-            # Top categories
-            category_counts = pd.Series(all_categories).value_counts().head(15)
-            category_counts.plot(kind='barh', ax=axes[0, 0], color='lightblue')
-            axes[0, 0].set_title("Top 15 Book Categories")
-            axes[0, 0].set_xlabel("Number of Books")
+        # Category distribution (pie chart for top 8)
+        top_8_categories = category_counts.head(8)
+        other_count = category_counts.iloc[8:].sum()
+        if other_count > 0:
+            pie_data = top_8_categories.copy()
+            pie_data['Others'] = other_count
+        else:
+            pie_data = top_8_categories
             
-            # Category distribution (pie chart for top 8)
-            top_8_categories = category_counts.head(8)
-            other_count = category_counts.iloc[8:].sum()
-            if other_count > 0:
-                pie_data = top_8_categories.copy()
-                pie_data['Others'] = other_count
-            else:
-                pie_data = top_8_categories
-                
-            axes[0, 1].pie(pie_data.values, labels=pie_data.index, autopct='%1.1f%%', startangle=90)
-            axes[0, 1].set_title("Category Distribution (Top Categories)")
+        axes[0, 1].pie(pie_data.values, labels=pie_data.index, autopct='%1.1f%%', startangle=90)
+        axes[0, 1].set_title("Category Distribution (Top Categories)")
     
     # Page count analysis
-    if 'num_pages' in df.columns:
-        pages = df['num_pages'].dropna()
-        pages = pages[(pages > 0) & (pages < 2000)]  # Reasonable range
-        
-        if len(pages) > 0:
-            pages.hist(bins=30, ax=axes[1, 0], alpha=0.7, color='lightsalmon', edgecolor='black')
-            axes[1, 0].set_title("Distribution of Book Page Counts")
-            axes[1, 0].set_xlabel("Number of Pages")
-            axes[1, 0].set_ylabel("Frequency")
-            axes[1, 0].axvline(pages.mean(), color='red', linestyle='--', 
-                              label=f'Mean: {pages.mean():.0f}')
-            axes[1, 0].legend()
+    if page_hist is not None:
+        page_values, counts, edges = page_hist
+        mean_pages = page_values.mean()
+        _fast_hist(axes[1, 0], counts, edges, alpha=0.7, color='lightsalmon', edgecolor='black')
+        axes[1, 0].set_title("Distribution of Book Page Counts")
+        axes[1, 0].set_xlabel("Number of Pages")
+        axes[1, 0].set_ylabel("Frequency")
+        axes[1, 0].axvline(mean_pages, color='red', linestyle='--', 
+                          label=f'Mean: {mean_pages:.0f}')
+        axes[1, 0].legend()
     
     # Authors analysis
-    if 'authors' in df.columns:
-        authors = df['authors'].dropna()
-        # Extract individual authors
-        all_authors = []
-        for author_string in authors:
-            if isinstance(author_string, str) and author_string.lower() != 'unknown':
-                # Split by common delimiters
-                auth_list = author_string.replace(',', ';').replace('&', ';').split(';')
-                all_authors.extend([auth.strip() for auth in auth_list if auth.strip()])
-        
-        if all_authors:
-            # Top authors by book count
-            author_counts = pd.Series(all_authors).value_counts().head(10)
-            author_counts.plot(kind='barh', ax=axes[1, 1], color='lightgreen')
-            axes[1, 1].set_title("Top 10 Most Prolific Authors")
-            axes[1, 1].set_xlabel("Number of Books")
+    if author_counts is not None and len(author_counts) > 0:
+        # Top authors by book count
+        author_counts.plot(kind='barh', ax=axes[1, 1], color='lightgreen')
+        axes[1, 1].set_title("Top 10 Most Prolific Authors")
+        axes[1, 1].set_xlabel("Number of Books")
     
     plt.tight_layout()
     plt.show()
@@ -285,10 +430,8 @@ def plot_correlation_matrix(df: pd.DataFrame) -> None:
     Args:
         df: Books DataFrame
     """
-    setup_plot_style()
-    
     # Select numeric columns
-    numeric_cols = df.select_dtypes(include=[np.number]).columns
+    numeric_cols = get_numeric_columns(df)
     
     if len(numeric_cols) > 1:
         plt.figure(figsize=(10, 8))
@@ -317,6 +460,9 @@ def create_summary_report(df: pd.DataFrame) -> str:
     Returns:
         Summary report as string
     """
+    missing_data = df.isnull().sum()
+    memory_mb = df.memory_usage(deep=needs_deep_memory_usage(df)).sum() / 1024**2
+    
     report = []
     report.append("="*60)
     report.append("BOOKS DATASET ANALYSIS SUMMARY")
@@ -326,10 +472,9 @@ def create_summary_report(df: pd.DataFrame) -> str:
     report.append(f"\n📊 DATASET OVERVIEW:")
     report.append(f"   • Total Books: {len(df):,}")
     report.append(f"   • Total Columns: {len(df.columns)}")
-    report.append(f"   • Memory Usage: {df.memory_usage(deep=True).sum() / 1024**2:.2f} MB")
+    report.append(f"   • Memory Usage: {memory_mb:.2f} MB")
     
     # Missing data
-    missing_data = df.isnull().sum()
     if missing_data.sum() > 0:
         report.append(f"\n❗ MISSING DATA:")
         for col, missing_count in missing_data[missing_data > 0].items():
@@ -337,7 +482,7 @@ def create_summary_report(df: pd.DataFrame) -> str:
             report.append(f"   • {col}: {missing_count:,} ({pct:.1f}%)")
     
     # Numeric summary
-    numeric_cols = df.select_dtypes(include=[np.number]).columns
+    numeric_cols = get_numeric_columns(df)
     if len(numeric_cols) > 0:
         report.append(f"\n📈 NUMERIC VARIABLES SUMMARY:")
         for col in numeric_cols:
@@ -352,11 +497,7 @@ def create_summary_report(df: pd.DataFrame) -> str:
     # Category analysis
     if 'categories' in df.columns:
         categories = df['categories'].dropna()
-        unique_categories = set()
-        for cat_string in categories:
-            if isinstance(cat_string, str):
-                cats = cat_string.replace(',', ';').replace('&', ';').split(';')
-                unique_categories.update([cat.strip() for cat in cats if cat.strip()])
+        unique_categories = _split_multi_value(categories, drop_unknown=False).unique()
         
         report.append(f"\n📚 CATEGORIES:")
         report.append(f"   • Unique Categories: {len(unique_categories)}")
@@ -364,8 +505,7 @@ def create_summary_report(df: pd.DataFrame) -> str:
     
     # Publication years
     if 'published_year' in df.columns:
-        pub_years = df['published_year'].dropna()
-        pub_years = pub_years[(pub_years >= 1800) & (pub_years <= 2024)]
+        pub_years = _clean_pub_years(df)
         if len(pub_years) > 0:
             report.append(f"\n📅 PUBLICATION YEARS:")
             report.append(f"   • Earliest: {pub_years.min():.0f}")
@@ -4,26 +4,180 @@ Data loading and preprocessing functions for the books dataset.
 
 import pandas as pd
 import numpy as np
-from typing import Optional, Tuple
+from typing import Dict, Optional, Tuple
 import logging
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+try:
+    from ..utils.helpers import get_numeric_columns
+except ImportError:
+    # Imported as a top-level module with src/ on the path (notebooks)
+    from utils.helpers import get_numeric_columns
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Known column types of the books dataset, applied by the CSV parser
+BOOKS_DTYPES = {
+    'categories': 'category',
+    'authors': 'string[pyarrow]' if HAS_PYARROW else 'string',
+    'published_year': 'Int16',
+    'num_pages': 'Int32',
+    'ratings_count': 'Int32',
+    'average_rating': 'float32'
+}
+
+
+def _split_dtypes(dtypes: Dict[str, str]) -> Tuple[Dict[str, str], Dict[str, str]]:
+    """
+    Split a dtype mapping into parse-time and post-parse dtypes.
+    
+    String and category hints can't fail while parsing, so they are safe to
+    force on the parser; numeric dtypes are applied after parsing so that a
+    single bad cell becomes missing instead of failing the load.
+    
+    Args:
+        dtypes: Column dtypes
+        
+    Returns:
+        Tuple of (parse-time dtypes, numeric dtypes)
+    """
+    parse_dtypes, numeric_dtypes = {}, {}
+    for col, dtype in dtypes.items():
+        if pd.api.types.is_numeric_dtype(pd.api.types.pandas_dtype(dtype)):
+            numeric_dtypes[col] = dtype
+        else:
+            parse_dtypes[col] = dtype
+    
+    return parse_dtypes, numeric_dtypes
+
+
+def _to_numeric_dtype(series: pd.Series, dtype: str) -> pd.Series:
+    """
+    Coerce a column to a numeric dtype, turning unusable values into missing.
+    
+    Args:
+        series: Column to convert
+        dtype: Target numeric dtype (e.g. 'Int16', 'float32')
+        
+    Returns:
+        Converted column; unparseable values, and for integer targets
+        fractional or out-of-range values, become missing
+    """
+    values = pd.to_numeric(series, errors='coerce')
+    target = pd.api.types.pandas_dtype(dtype)
+    
+    if pd.api.types.is_integer_dtype(target):
+        info = np.iinfo(getattr(target, 'numpy_dtype', target))
+        fits = (values % 1 == 0) & values.between(info.min, info.max)
+        values = values.where(fits.fillna(False).astype(bool))
+    
+    return values.astype(target)
+
+
+def _apply_numeric_dtypes(df: pd.DataFrame, dtypes: Dict[str, str]) -> pd.DataFrame:
+    """
+    Convert the numeric columns of a parsed DataFrame to their target dtypes.
+    
+    Args:
+        df: Parsed DataFrame
+        dtypes: Numeric column dtypes
+        
+    Returns:
+        DataFrame with the present numeric columns converted
+    """
+    for col, dtype in dtypes.items():
+        if col in df.columns:
+            df[col] = _to_numeric_dtype(df[col], dtype)
+    
+    return df
+
+
+def _read_csv_arrow(filepath: str, dtypes: Dict[str, str], block_size: Optional[int] = None) -> pd.DataFrame:
+    """
+    Parse a CSV file with pyarrow's multi-threaded block reader.
+    
+    Args:
+        filepath: Path to the CSV file
+        dtypes: Column dtypes; string and category types are applied while
+            parsing, numeric types after parsing
+        block_size: Bytes per parse block (defaults to pyarrow's 1 MiB, so
+            files of a few MB are split across threads)
+        
+    Returns:
+        DataFrame with the requested column dtypes; numeric cells that can't
+        be converted are left missing
+    """
+    arrow_types = {
+        'category': pa.dictionary(pa.int32(), pa.string()),
+        'string': pa.string(),
+        'string[pyarrow]': pa.string()
+    }
+    parse_dtypes, numeric_dtypes = _split_dtypes(dtypes)
+    column_types = {col: arrow_types[dtype] for col, dtype in parse_dtypes.items() if dtype in arrow_types}
+    
+    read_options = pacsv.ReadOptions(use_threads=True)
+    if block_size is not None:
+        read_options.block_size = block_size
+    
+    table = pacsv.read_csv(
+        filepath,
+        read_options=read_options,
+        # Free-text columns such as description contain quoted line breaks
+        parse_options=pacsv.ParseOptions(newlines_in_values=True),
+        convert_options=pacsv.ConvertOptions(column_types=column_types, strings_can_be_null=True)
+    )
+    df = table.to_pandas()
+    df = df.astype({col: dtype for col, dtype in parse_dtypes.items() if col in df.columns})
+    
+    # Numeric columns are inferred by the parser (e.g. "2004.0" as double)
+    # and converted here, so one bad cell never forces a re-parse
+    return _apply_numeric_dtypes(df, numeric_dtypes)
+
+
+def _read_csv_lenient(filepath: str, dtypes: Dict[str, str]) -> pd.DataFrame:
+    """
+    Parse a CSV file with pandas, applying numeric dtypes after parsing.
+    
+    Args:
+        filepath: Path to the CSV file
+        dtypes: Column dtypes
+        
+    Returns:
+        DataFrame with the requested column dtypes; numeric cells that can't
+        be converted are left missing
+    """
+    parse_dtypes, numeric_dtypes = _split_dtypes(dtypes)
+    df = pd.read_csv(filepath, dtype=parse_dtypes)
+    return _apply_numeric_dtypes(df, numeric_dtypes)
+
 
-def load_books_data(filepath: str = "books.csv") -> pd.DataFrame:
+def load_books_data(filepath: str = "books.csv", dtypes: Optional[Dict[str, str]] = None) -> pd.DataFrame:
     """
     Load the books dataset from CSV file.
     
     Args:
         filepath: Path to the CSV file containing books data
+        dtypes: Column dtypes passed to the parser (defaults to BOOKS_DTYPES)
         
     Returns:
         DataFrame containing the books data
     """
+    if dtypes is None:
+        dtypes = BOOKS_DTYPES
+    
     try:
         logger.info(f"Loading books data from {filepath}")
-        df = pd.read_csv(filepath)
+        if HAS_PYARROW:
+            df = _read_csv_arrow(filepath, dtypes)
+        else:
+            df = _read_csv_lenient(filepath, dtypes)
         logger.info(f"Successfully loaded {len(df)} books")
         return df
     except FileNotFoundError:
@@ -54,21 +208,25 @@ def clean_books_data(df: pd.DataFrame) -> pd.DataFrame:
     
     # Fill missing numeric values with appropriate defaults
     numeric_columns = ['published_year', 'average_rating', 'num_pages', 'ratings_count']
-    for col in numeric_columns:
-        if col in cleaned_df.columns:
-            cleaned_df[col] = pd.to_numeric(cleaned_df[col], errors='coerce')
+    num_present = [col for col in numeric_columns if col in cleaned_df.columns]
+    if num_present:
+        # Coerce and downcast to the compact dataset types; unparseable,
+        # fractional or out-of-range integer values become <NA>
+        cleaned_df = _apply_numeric_dtypes(cleaned_df, {col: BOOKS_DTYPES[col] for col in num_present})
     
     # Fill missing categorical values
     categorical_columns = ['authors', 'categories', 'subtitle']
-    for col in categorical_columns:
-        if col in cleaned_df.columns:
-            cleaned_df[col] = cleaned_df[col].fillna('Unknown')
+    cat_present = [col for col in categorical_columns if col in cleaned_df.columns]
+    for col in cat_present:
+        # Categorical columns need the fill value registered as a category
+        if isinstance(cleaned_df[col].dtype, pd.CategoricalDtype) and 'Unknown' not in cleaned_df[col].cat.categories:
+            cleaned_df[col] = cleaned_df[col].cat.add_categories('Unknown')
+    if cat_present:
+        cleaned_df[cat_present] = cleaned_df[cat_present].fillna('Unknown')
     
     # Remove rows with missing essential information
     essential_columns = ['title', 'authors']
-    for col in essential_columns:
-        if col in cleaned_df.columns:
-            cleaned_df = cleaned_df.dropna(subset=[col])
+    cleaned_df = cleaned_df.dropna(subset=[col for col in essential_columns if col in cleaned_df.columns])
     
     # Remove duplicates
     logger.info("Removing duplicates")
@@ -80,9 +238,16 @@ def clean_books_data(df: pd.DataFrame) -> pd.DataFrame:
     # Clean text data
     logger.info("Cleaning text data")
     text_columns = ['title', 'authors', 'categories', 'description']
-    for col in text_columns:
-        if col in cleaned_df.columns:
-            cleaned_df[col] = cleaned_df[col].astype(str).str.strip()
+    txt_present = [col for col in text_columns if col in cleaned_df.columns]
+    if txt_present:
+        cleaned_df[txt_present] = cleaned_df[txt_present].apply(lambda s: s.astype(str).str.strip())
+    
+    # Store low-cardinality text columns as categoricals to cut memory and
+    # speed up value_counts/equality checks downstream. Group on these with
+    # observed=True to avoid materialising unused category combinations.
+    for col in cat_present:
+        if cleaned_df[col].nunique() < 0.5 * len(cleaned_df):
+            cleaned_df[col] = cleaned_df[col].astype('category')
     
     logger.info(f"Data cleaning completed. Final dataset size: {len(cleaned_df)}")
     return cleaned_df
@@ -98,13 +263,15 @@ def get_data_info(df: pd.DataFrame) -> dict:
     Returns:
         Dictionary containing dataset information
     """
+    numeric_cols = get_numeric_columns(df)
+    
     info = {
         'shape': df.shape,
         'columns': df.columns.tolist(),
         'dtypes': df.dtypes.to_dict(),
         'missing_values': df.isnull().sum().to_dict(),
         'memory_usage': df.memory_usage(deep=True).sum(),
-        'numeric_summary': df.describe().to_dict() if len(df.select_dtypes(include=[np.number]).columns) > 0 else {}
+        'numeric_summary': df[numeric_cols].describe().to_dict() if len(numeric_cols) > 0 else {}
     }
     
     return info
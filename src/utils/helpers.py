@@ -6,9 +6,17 @@ import pandas as pd
 import numpy as np
 import os
 import logging
-from typing import Dict, List, Any, Optional
+from collections.abc import Mapping
+from functools import cached_property
+from typing import Dict, Iterator, List, Any, Optional, Tuple
 import json
 
+try:
+    import pyarrow as pa
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
 
 def setup_logging(level: str = 'INFO') -> logging.Logger:
     """
@@ -38,7 +46,7 @@ def create_directory(path: str) -> None:
     os.makedirs(path, exist_ok=True)
 
 
-def save_dataframe(df: pd.DataFrame, filepath: str, format: str = 'csv') -> None:
+def save_dataframe(df: pd.DataFrame, filepath: str, format: str = 'csv', compression: Optional[str] = 'zstd') -> None:
     """
     Save DataFrame to file.
     
@@ -46,13 +54,30 @@ def save_dataframe(df: pd.DataFrame, filepath: str, format: str = 'csv') -> None
         df: DataFrame to save
         filepath: Output file path
         format: File format ('csv', 'parquet', 'json')
+        compression: Parquet compression codec, or None for uncompressed;
+            a known codec missing from the installed pyarrow build falls
+            back to 'snappy', an unknown name raises ValueError
     """
     create_directory(os.path.dirname(filepath))
     
     if format.lower() == 'csv':
         df.to_csv(filepath, index=False)
     elif format.lower() == 'parquet':
-        df.to_parquet(filepath, index=False)
+        if HAS_PYARROW:
+            if compression is not None:
+                try:
+                    available = pa.Codec.is_available(compression)
+                except ValueError:
+                    raise ValueError(f"Unsupported compression: {compression}")
+                if not available:
+                    compression = 'snappy'
+            options = {'compression_level': 3} if compression is not None and compression.lower() == 'zstd' else {}
+            # Dictionary-encode the low-cardinality text columns only
+            dictionary_columns = [col for col in ('categories', 'authors', 'subtitle') if col in df.columns]
+            df.to_parquet(filepath, index=False, engine='pyarrow', compression=compression,
+                          use_dictionary=dictionary_columns, row_group_size=128_000, **options)
+        else:
+            df.to_parquet(filepath, index=False, compression=compression)
     elif format.lower() == 'json':
         df.to_json(filepath, orient='records', indent=2)
     else:
@@ -112,17 +137,63 @@ def clean_text(text: str) -> str:
     return text.strip()
 
 
+def get_numeric_columns(df: pd.DataFrame) -> List[str]:
+    """
+    Get the names of numeric columns.
+    
+    Args:
+        df: DataFrame to inspect
+        
+    Returns:
+        List of column names selected by select_dtypes(include=[np.number])
+    """
+    return df.select_dtypes(include=[np.number]).columns.tolist()
+
+
+def needs_deep_memory_usage(df: pd.DataFrame) -> bool:
+    """
+    Check whether any column or the index stores Python objects.
+    
+    Only such columns and index levels (object dtype, Python-backed
+    strings, categoricals with object categories) report a different size
+    with memory_usage(deep=True), and the deep walk over them costs time
+    proportional to the total string bytes.
+    
+    Args:
+        df: DataFrame to check
+        
+    Returns:
+        True if a deep memory count is needed for an accurate total
+    """
+    if isinstance(df.index, pd.MultiIndex):
+        index_dtypes = [level.dtype for level in df.index.levels]
+    else:
+        index_dtypes = [df.index.dtype]
+    
+    for dtype in [*df.dtypes, *index_dtypes]:
+        if isinstance(dtype, pd.CategoricalDtype):
+            dtype = dtype.categories.dtype
+        if dtype == object or (isinstance(dtype, pd.StringDtype) and dtype.storage == 'python'):
+            return True
+    
+    return False
+
+
 def get_memory_usage(df: pd.DataFrame) -> Dict[str, float]:
     """
     Get detailed memory usage information for DataFrame.
     
+    The deep (per-object) count is only taken when some column or index
+    level stores Python objects; when none does, the shallow count equals
+    the deep one.
+    
     Args:
         df: DataFrame to analyze
         
     Returns:
         Dictionary with memory usage information
     """
-    memory_usage = df.memory_usage(deep=True)
+    memory_usage = df.memory_usage(deep=needs_deep_memory_usage(df))
     
     return {
         'total_mb': memory_usage.sum() / 1024**2,
@@ -144,12 +215,13 @@ def print_dataframe_info(df: pd.DataFrame, name: str = "DataFrame") -> None:
     print(f"{'='*50}")
     
     print(f"Shape: {df.shape[0]} rows × {df.shape[1]} columns")
-    print(f"Memory usage: {df.memory_usage(deep=True).sum() / 1024**2:.2f} MB")
+    print(f"Memory usage: {df.memory_usage(deep=needs_deep_memory_usage(df)).sum() / 1024**2:.2f} MB")
+    
+    nulls = df.isnull().sum()
     
     print(f"\nColumn Information:")
-    for col in df.columns:
-        dtype = df[col].dtype
-        null_count = df[col].isnull().sum()
+    for col, dtype in df.dtypes.items():
+        null_count = nulls[col]
         null_pct = (null_count / len(df)) * 100
         print(f"  {col:20s} | {str(dtype):10s} | {null_count:5d} nulls ({null_pct:5.1f}%)")
     
@@ -157,18 +229,23 @@ def print_dataframe_info(df: pd.DataFrame, name: str = "DataFrame") -> None:
     print(df.head(3).to_string())
 
 
-def validate_dataframe(df: pd.DataFrame, required_columns: List[str]) -> bool:
+def validate_dataframe(df: pd.DataFrame, required_columns: List[str],
+                       column_set: Optional[set] = None) -> bool:
     """
     Validate that DataFrame has required columns.
     
     Args:
         df: DataFrame to validate
         required_columns: List of required column names
+        column_set: Precomputed set(df.columns), for callers validating repeatedly
         
     Returns:
         True if valid, False otherwise
     """
-    missing_columns = set(required_columns) - set(df.columns)
+    if column_set is None:
+        column_set = set(df.columns)
+    
+    missing_columns = set(required_columns) - column_set
     
     if missing_columns:
         logging.error(f"Missing required columns: {missing_columns}")
@@ -192,7 +269,10 @@ def sample_dataframe(df: pd.DataFrame, n_samples: int = 1000, random_state: int
     if len(df) <= n_samples:
         return df
     
-    return df.sample(n=n_samples, random_state=random_state).reset_index(drop=True)
+    # Draw row positions directly instead of permuting the whole index
+    rng = np.random.default_rng(random_state)
+    idx = rng.choice(len(df), size=n_samples, replace=False)
+    return df.iloc[idx].reset_index(drop=True)
 
 
 def calculate_text_stats(text_series: pd.Series) -> Dict[str, float]:
@@ -205,103 +285,191 @@ def calculate_text_stats(text_series: pd.Series) -> Dict[str, float]:
     Returns:
         Dictionary with text statistics
     """
-    # Remove null values
-    clean_text = text_series.dropna().astype(str)
+    # Remove null values; Arrow-backed strings keep the counting in C
+    clean_text = text_series.dropna().astype('string[pyarrow]' if HAS_PYARROW else str)
     
     if len(clean_text) == 0:
         return {}
     
-    # Calculate word counts
-    word_counts = clean_text.str.split().str.len()
+    # Calculate word counts without materialising token lists. Arrow's RE2
+    # \s is ASCII-only, so add the other separators str.split() honours
+    # (Unicode spaces such as \xa0, \v, \x1c-\x1f and \x85)
+    word_pattern = r'[^\s\p{Z}\x0b\x1c-\x1f\x85]+' if HAS_PYARROW else r'\S+'
+    word_counts = clean_text.str.count(word_pattern)
     
     # Calculate character counts
     char_counts = clean_text.str.len()
     
+    aggregations = ['mean', 'median', 'max', 'min']
+    word_stats = word_counts.agg(aggregations)
+    char_stats = char_counts.agg(aggregations)
+    
     stats = {
         'total_entries': len(clean_text),
-        'avg_words': word_counts.mean(),
-        'median_words': word_counts.median(),
-        'max_words': word_counts.max(),
-        'min_words': word_counts.min(),
-        'avg_chars': char_counts.mean(),
-        'median_chars': char_counts.median(),
-        'max_chars': char_counts.max(),
-        'min_chars': char_counts.min()
+        'avg_words': word_stats['mean'],
+        'median_words': word_stats['median'],
+        'max_words': int(word_stats['max']),
+        'min_words': int(word_stats['min']),
+        'avg_chars': char_stats['mean'],
+        'median_chars': char_stats['median'],
+        'max_chars': int(char_stats['max']),
+        'min_chars': int(char_stats['min'])
     }
     
     return stats
 
 
+class LazyProfile(Mapping):
+    """Read-only profile mapping that computes each section on first access."""
+    
+    def __init__(self, profiler: 'DataFrameProfiler'):
+        self._profiler = profiler
+    
+    def __getitem__(self, key: str) -> Any:
+        if key not in DataFrameProfiler.SECTIONS:
+            raise KeyError(key)
+        return getattr(self._profiler, key)
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(DataFrameProfiler.SECTIONS)
+    
+    def __len__(self) -> int:
+        return len(DataFrameProfiler.SECTIONS)
+    
+    def __repr__(self) -> str:
+        return f"LazyProfile(sections={list(self)})"
+
+
 class DataFrameProfiler:
-    """Class for comprehensive DataFrame profiling."""
+    """
+    Class for comprehensive DataFrame profiling.
+    
+    Each profile section is computed on first access and cached, so the
+    profiler reflects the DataFrame as it was when a section was first read.
+    """
+    
+    SECTIONS = ('shape', 'memory_usage', 'missing_data', 'data_types',
+                'numeric_summary', 'text_summary', 'duplicates')
     
     def __init__(self, df: pd.DataFrame):
         self.df = df
         self.profile = {}
-    
-    def generate_profile(self) -> Dict[str, Any]:
-        """Generate comprehensive profile of the DataFrame."""
-        self.profile = {
-            'shape': self.df.shape,
-            'memory_usage': get_memory_usage(self.df),
-            'missing_data': self._analyze_missing_data(),
-            'data_types': self._analyze_data_types(),
-            'numeric_summary': self._analyze_numeric_data(),
-            'text_summary': self._analyze_text_data(),
-            'duplicates': self._analyze_duplicates()
-        }
+        
+        # Column groups by dtype, shared by the analysis sections
+        self._dtypes = df.dtypes
+        self._numeric_cols = get_numeric_columns(df)
+        # Text columns: object, string and string-valued categorical dtypes
+        self._object_cols = [
+            col for col, dtype in self._dtypes.items()
+            if pd.api.types.is_string_dtype(dtype)
+            or (isinstance(dtype, pd.CategoricalDtype) and pd.api.types.is_string_dtype(dtype.categories.dtype))
+        ]
+        self._datetime_cols = df.select_dtypes(include=['datetime']).columns.tolist()
+    
+    def generate_profile(self, full: bool = False) -> Mapping[str, Any]:
+        """
+        Generate comprehensive profile of the DataFrame.
+        
+        Args:
+            full: Compute every section now and return a plain dict; by default
+                a LazyProfile is returned that computes sections on access
+                
+        Returns:
+            Mapping from section name to section results
+        """
+        if full:
+            self.profile = {section: getattr(self, section) for section in self.SECTIONS}
+        else:
+            self.profile = LazyProfile(self)
         
         return self.profile
     
-    def _analyze_missing_data(self) -> Dict[str, Any]:
+    @cached_property
+    def _dup_mask(self) -> pd.Series:
+        return self.df.duplicated()
+    
+    @cached_property
+    def shape(self) -> Tuple[int, int]:
+        """DataFrame shape."""
+        return self.df.shape
+    
+    @cached_property
+    def memory_usage(self) -> Dict[str, float]:
+        """Memory usage information."""
+        return get_memory_usage(self.df)
+    
+    @cached_property
+    def missing_data(self) -> Dict[str, Any]:
         """Analyze missing data patterns."""
-        missing_counts = self.df.isnull().sum()
+        # Reduce the full-frame mask here so only the per-column and
+        # per-row results outlive this call
+        isnull = self.df.isnull()
+        missing_counts = isnull.sum()
+        complete_rows = len(self.df) - isnull.any(axis=1).sum()
         missing_percentages = (missing_counts / len(self.df)) * 100
         
         return {
             'total_missing': missing_counts.sum(),
             'missing_by_column': missing_counts.to_dict(),
             'missing_percentages': missing_percentages.to_dict(),
-            'complete_rows': len(self.df) - self.df.isnull().any(axis=1).sum()
+            'complete_rows': complete_rows
         }
     
-    def _analyze_data_types(self) -> Dict[str, Any]:
+    @cached_property
+    def data_types(self) -> Dict[str, Any]:
         """Analyze data types distribution."""
-        dtype_counts = self.df.dtypes.value_counts()
+        dtype_counts = self._dtypes.value_counts()
         
         return {
             'type_distribution': dtype_counts.to_dict(),
-            'numeric_columns': self.df.select_dtypes(include=[np.number]).columns.tolist(),
-            'text_columns': self.df.select_dtypes(include=['object']).columns.tolist(),
-            'datetime_columns': self.df.select_dtypes(include=['datetime']).columns.tolist()
+            'numeric_columns': list(self._numeric_cols),
+            'text_columns': list(self._object_cols),
+            'datetime_columns': list(self._datetime_cols)
         }
     
-    def _analyze_numeric_data(self) -> Dict[str, Any]:
-        """Analyze numeric columns."""
-        numeric_df = self.df.select_dtypes(include=[np.number])
+    @cached_property
+    def numeric_summary(self) -> Dict[str, Any]:
+        """
+        Analyze numeric columns.
+        
+        Statistics are kept as DataFrames rather than nested dicts; they index
+        the same way (stats[column][statistic]) and are empty when there are
+        too few numeric columns. Use numeric_summary_dict for plain dicts.
+        """
+        if len(self._numeric_cols) == 0:
+            return {'summary_stats': pd.DataFrame(), 'correlations': pd.DataFrame()}
         
-        if len(numeric_df.columns) == 0:
-            return {}
+        numeric_df = self.df[self._numeric_cols]
         
         return {
-            'summary_stats': numeric_df.describe().to_dict(),
-            'correlations': numeric_df.corr().to_dict() if len(numeric_df.columns) > 1 else {}
+            'summary_stats': numeric_df.describe(),
+            'correlations': numeric_df.corr() if len(self._numeric_cols) > 1 else pd.DataFrame()
         }
     
-    def _analyze_text_data(self) -> Dict[str, Any]:
+    @cached_property
+    def numeric_summary_dict(self) -> Dict[str, Dict[str, Any]]:
+        """Numeric summary converted to nested dicts."""
+        return {name: stats.to_dict() for name, stats in self.numeric_summary.items()}
+    
+    @cached_property
+    def text_summary(self) -> Dict[str, Any]:
         """Analyze text columns."""
-        text_columns = self.df.select_dtypes(include=['object']).columns
         text_analysis = {}
         
-        for col in text_columns:
+        for col in self._object_cols:
             text_analysis[col] = calculate_text_stats(self.df[col])
         
         return text_analysis
     
-    def _analyze_duplicates(self) -> Dict[str, Any]:
+    @cached_property
+    def duplicates(self) -> Dict[str, Any]:
         """Analyze duplicate records."""
+        n_rows = len(self.df)
+        total_duplicates = int(self._dup_mask.sum())
+        
+        # Unique rows follow from the duplicate mask; no deduplicated copy needed
         return {
-            'total_duplicates': self.df.duplicated().sum(),
-            'duplicate_percentage': (self.df.duplicated().sum() / len(self.df)) * 100,
-            'unique_rows': len(self.df.drop_duplicates())
+            'total_duplicates': total_duplicates,
+            'duplicate_percentage': (total_duplicates / n_rows) * 100 if n_rows else 0.0,
+            'unique_rows': n_rows - total_duplicates
         } 
\ No newline at end of file
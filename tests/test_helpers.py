@@ -0,0 +1,38 @@
+"""
+Tests for general utility functions.
+"""
+
+import pandas as pd
+
+from src.utils.helpers import calculate_text_stats, get_memory_usage, needs_deep_memory_usage
+
+
+def test_calculate_text_stats_matches_str_split_word_counts():
+    """Word counts agree with str.split(), including non-breaking spaces."""
+    texts = pd.Series(['a\xa0b', 'x y z', 'a  b\tc', 'one two', ' ', ''])
+    expected = pd.Series([len(text.split()) for text in texts])
+    
+    stats = calculate_text_stats(texts)
+    
+    assert stats['avg_words'] == expected.mean()
+    assert stats['max_words'] == expected.max()
+    assert stats['min_words'] == expected.min()
+
+
+def test_get_memory_usage_counts_object_index_deeply():
+    """An object index is measured deeply even when all columns are numeric."""
+    df = pd.DataFrame({'rating': range(1000)},
+                      index=pd.Index([f'Title {i}' for i in range(1000)], dtype=object))
+    
+    usage = get_memory_usage(df)
+    
+    assert usage['total_mb'] == df.memory_usage(deep=True).sum() / 1024**2
+
+
+def test_needs_deep_memory_usage_checks_multiindex_levels():
+    """Each MultiIndex level is checked, not the MultiIndex's object dtype."""
+    numeric = pd.MultiIndex.from_arrays([[1, 2], [3, 4]])
+    mixed = pd.MultiIndex.from_arrays([[1, 2], pd.Index(['a', 'b'], dtype=object)])
+    
+    assert not needs_deep_memory_usage(pd.DataFrame({'x': [1, 2]}, index=numeric))
+    assert needs_deep_memory_usage(pd.DataFrame({'x': [1, 2]}, index=mixed))
@@ -0,0 +1,29 @@
+"""
+Tests for data loading functions.
+"""
+
+import pandas as pd
+import pytest
+
+from src.data import loader
+
+
+def test_read_csv_arrow_multi_block_quoted_newlines(tmp_path):
+    """Quoted line breaks in description survive a parse split across blocks."""
+    pytest.importorskip('pyarrow')
+    
+    n_rows = 2000
+    df = pd.DataFrame({
+        'title': [f'Book {i}' for i in range(n_rows)],
+        'authors': ['Jane Doe'] * n_rows,
+        'description': [f'First line {i}\nsecond line' for i in range(n_rows)],
+        'published_year': [2000 + i % 20 for i in range(n_rows)]
+    })
+    filepath = tmp_path / 'books.csv'
+    df.to_csv(filepath, index=False)
+    
+    loaded = loader._read_csv_arrow(str(filepath), loader.BOOKS_DTYPES, block_size=4 << 10)
+    
+    assert len(loaded) == n_rows
+    assert loaded['description'].iloc[-1] == f'First line {n_rows - 1}\nsecond line'
+    assert loaded['published_year'].tolist() == df['published_year'].tolist()